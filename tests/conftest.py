@@ -0,0 +1,29 @@
+"""Shared pytest fixtures."""
+
+import argparse
+from collections import Counter
+
+import pytest
+
+from weather_report.cli import build_parser
+from weather_report.countries import Country, get_all_countries
+
+
+@pytest.fixture(scope="session")
+def all_countries() -> list[Country]:
+    return get_all_countries()
+
+
+@pytest.fixture(scope="session")
+def parser() -> argparse.ArgumentParser:
+    return build_parser()
+
+
+@pytest.fixture(scope="session")
+def country_index(all_countries) -> dict[str, Country]:
+    return {c.name.casefold(): c for c in all_countries}
+
+
+@pytest.fixture(scope="session")
+def continent_counts(all_countries) -> Counter[str]:
+    return Counter(c.continent for c in all_countries)
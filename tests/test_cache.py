@@ -0,0 +1,75 @@
+"""Unit tests for the cache module."""
+
+import json
+
+from weather_report.cache import DiskCache
+
+
+class TestDiskCache:
+    def test_roundtrip(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=60)
+        cache.set("key", {"temperature_2m": 25.0})
+        assert cache.get("key") == {"temperature_2m": 25.0}
+
+    def test_missing_key(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=60)
+        assert cache.get("missing") is None
+
+    def test_expired_entry(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=0)
+        cache.set("key", {"temperature_2m": 25.0})
+        assert cache.get("key") is None
+
+    def test_creates_directory(self, tmp_path):
+        cache = DiskCache(tmp_path / "nested" / "dir", ttl=60)
+        cache.set("key", [1, 2, 3])
+        assert cache.get("key") == [1, 2, 3]
+
+    def test_corrupt_entry_ignored(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=60)
+        (tmp_path / "key.json").write_text("not json", encoding="utf-8")
+        assert cache.get("key") is None
+
+    def test_entry_written_as_json(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=60)
+        cache.set("key", "value")
+        entry = json.loads((tmp_path / "key.json").read_text(encoding="utf-8"))
+        assert entry["value"] == "value"
+        assert "stored_at" in entry
+
+    def test_get_stale_returns_expired_entry(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=0)
+        cache.set("key", "value", {"etag": '"abc"'})
+        assert cache.get("key") is None
+        assert cache.get_stale("key") == ("value", {"etag": '"abc"'})
+
+    def test_get_stale_without_validators(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=60)
+        cache.set("key", "value")
+        assert cache.get_stale("key") == ("value", {})
+
+    def test_get_stale_missing_key(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=60)
+        assert cache.get_stale("missing") is None
+
+    def test_get_with_age(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=60)
+        cache.set("key", "value")
+        value, age = cache.get_with_age("key")
+        assert value == "value"
+        assert 0.0 <= age < 60
+
+    def test_failed_write_removes_temp_file(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=60)
+        cache.set("key", {"bad": object()})
+        assert list(tmp_path.iterdir()) == []
+        assert cache.get("key") is None
+
+    def test_failed_replace_removes_temp_file(self, tmp_path, monkeypatch):
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("weather_report.cache.os.replace", fail_replace)
+        cache = DiskCache(tmp_path, ttl=60)
+        cache.set("key", "value")
+        assert list(tmp_path.iterdir()) == []
@@ -1,14 +1,20 @@
 """Unit tests for the CLI module."""
 
+import io
+import subprocess
+import sys
+from contextlib import redirect_stderr, redirect_stdout
 from unittest.mock import patch
 
+import pytest
+
 from weather_report.cli import (
-    build_parser,
     cmd_continent,
     cmd_country,
     cmd_list_continents,
     cmd_list_countries,
 )
+from weather_report.countries import get_countries_by_continent
 from weather_report.weather_service import WeatherCondition, WeatherData, WeatherServiceError
 
 SAMPLE_WEATHER = WeatherData(
@@ -16,7 +22,6 @@ SAMPLE_WEATHER = WeatherData(
     capital="New Delhi",
     continent="Asia",
     temperature_celsius=35.0,
-    temperature_fahrenheit=95.0,
     humidity=50,
     wind_speed_kmh=12.0,
     condition=WeatherCondition.CLEAR,
@@ -24,98 +29,97 @@ SAMPLE_WEATHER = WeatherData(
 )
 
 
-class TestBuildParser:
-    def test_parser_creation(self):
-        parser = build_parser()
-        assert parser is not None
-
-    def test_parse_all_command(self):
-        parser = build_parser()
-        args = parser.parse_args(["all"])
-        assert args.command == "all"
-
-    def test_parse_country_command(self):
-        parser = build_parser()
-        args = parser.parse_args(["country", "India"])
-        assert args.command == "country"
-        assert args.name == "India"
-
-    def test_parse_continent_command(self):
-        parser = build_parser()
-        args = parser.parse_args(["continent", "Asia"])
-        assert args.command == "continent"
-        assert args.name == "Asia"
+def run_command(command, *args):
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        result = command(*args)
+    return result, out.getvalue(), err.getvalue()
 
-    def test_parse_list_countries(self):
-        parser = build_parser()
-        args = parser.parse_args(["list-countries"])
-        assert args.command == "list-countries"
 
-    def test_parse_list_continents(self):
-        parser = build_parser()
-        args = parser.parse_args(["list-continents"])
-        assert args.command == "list-continents"
+class TestBuildParser:
+    def test_parser_creation(self, parser):
+        assert parser is not None
 
-    def test_no_command(self):
-        parser = build_parser()
-        args = parser.parse_args([])
-        assert args.command is None
+    @pytest.mark.parametrize(
+        "argv,command,name",
+        [
+            (["all"], "all", None),
+            (["country", "India"], "country", "India"),
+            (["continent", "Asia"], "continent", "Asia"),
+            (["list-countries"], "list-countries", None),
+            (["list-continents"], "list-continents", None),
+            ([], None, None),
+        ],
+        ids=["all", "country", "continent", "list_countries", "list_continents", "no_command"],
+    )
+    def test_parse(self, parser, argv, command, name):
+        args = parser.parse_args(argv)
+        assert args.command == command
+        assert getattr(args, "name", None) == name
+
+    def test_no_cache_flag(self, parser):
+        assert parser.parse_args(["all"]).no_cache is False
+        assert parser.parse_args(["--no-cache", "all"]).no_cache is True
+
+
+class TestImports:
+    def test_cli_import_does_not_load_requests(self):
+        code = "import sys, weather_report.cli; print('requests' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.stdout.strip() == "False"
 
 
 class TestCmdCountry:
-    @patch("weather_report.cli.fetch_weather")
-    def test_valid_country(self, mock_fetch, capsys):
+    @patch("weather_report.weather_service.fetch_weather")
+    def test_valid_country(self, mock_fetch):
         mock_fetch.return_value = SAMPLE_WEATHER
-        result = cmd_country("India")
+        result, out, _ = run_command(cmd_country, "India")
         assert result == 0
-        captured = capsys.readouterr()
-        assert "India" in captured.out
+        assert "India" in out
 
-    def test_invalid_country(self, capsys):
-        result = cmd_country("Atlantis")
-        assert result == 1
-        captured = capsys.readouterr()
-        assert "not found" in captured.err
-
-    @patch("weather_report.cli.fetch_weather")
-    def test_api_error(self, mock_fetch, capsys):
+    @patch("weather_report.weather_service.fetch_weather")
+    def test_api_error(self, mock_fetch):
         mock_fetch.side_effect = WeatherServiceError("API failed")
-        result = cmd_country("India")
+        result, _, err = run_command(cmd_country, "India")
         assert result == 1
-        captured = capsys.readouterr()
-        assert "Error" in captured.err
+        assert "Error" in err
 
 
 class TestCmdContinent:
-    @patch("weather_report.cli.fetch_weather_batch")
-    def test_valid_continent(self, mock_batch, capsys):
+    @patch("weather_report.weather_service.fetch_weather_batch")
+    def test_valid_continent(self, mock_batch):
         mock_batch.return_value = [SAMPLE_WEATHER]
-        result = cmd_continent("Asia")
+        result, out, _ = run_command(cmd_continent, "Asia")
         assert result == 0
-        captured = capsys.readouterr()
-        assert "Asia" in captured.out
+        assert "Asia" in out
+
 
-    def test_invalid_continent(self, capsys):
-        result = cmd_continent("Narnia")
+class TestCmdInvalidLookup:
+    @pytest.mark.parametrize(
+        "command,name",
+        [(cmd_country, "Atlantis"), (cmd_continent, "Narnia")],
+        ids=["country", "continent"],
+    )
+    def test_not_found(self, command, name):
+        result, _, err = run_command(command, name)
         assert result == 1
-        captured = capsys.readouterr()
-        assert "not found" in captured.err
+        assert "not found" in err
 
 
 class TestCmdListCountries:
-    def test_list_countries(self, capsys):
-        result = cmd_list_countries()
+    def test_list_countries(self):
+        result, out, _ = run_command(cmd_list_countries)
         assert result == 0
-        captured = capsys.readouterr()
-        assert "India" in captured.out
-        assert "Japan" in captured.out
+        assert "India" in out
+        assert "Japan" in out
 
 
 class TestCmdListContinents:
-    def test_list_continents(self, capsys):
-        result = cmd_list_continents()
+    def test_list_continents(self):
+        result, out, _ = run_command(cmd_list_continents)
         assert result == 0
-        captured = capsys.readouterr()
-        assert "Africa" in captured.out
-        assert "Asia" in captured.out
-        assert "Europe" in captured.out
+        assert "Africa" in out
+        assert "Asia" in out
+        assert "Europe" in out
+        oceania = len(get_countries_by_continent("Oceania"))
+        assert f"Oceania              ({oceania} countries)" in out
@@ -1,5 +1,7 @@
 """Unit tests for the countries module."""
 
+import dataclasses
+
 import pytest
 
 from weather_report.countries import (
@@ -20,10 +22,25 @@ class TestCountryDataclass:
         assert country.longitude == 20.0
         assert country.continent == "TestContinent"
 
-    def test_country_is_frozen(self):
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("name", "Changed"),
+            ("capital", "Changed"),
+            ("latitude", 0.0),
+            ("longitude", 0.0),
+            ("continent", "Changed"),
+        ],
+        ids=["name", "capital", "latitude", "longitude", "continent"],
+    )
+    def test_country_is_frozen(self, field, value):
+        country = Country("TestLand", "TestCity", 10.0, 20.0, "TestContinent")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            setattr(country, field, value)
+
+    def test_country_has_no_instance_dict(self):
         country = Country("TestLand", "TestCity", 10.0, 20.0, "TestContinent")
-        with pytest.raises(AttributeError):
-            country.name = "Changed"
+        assert not hasattr(country, "__dict__")
 
     def test_country_equality(self):
         c1 = Country("TestLand", "TestCity", 10.0, 20.0, "TestContinent")
@@ -37,121 +54,92 @@ class TestCountryDataclass:
 
 
 class TestGetAllCountries:
-    def test_returns_list(self):
-        countries = get_all_countries()
-        assert isinstance(countries, list)
+    def test_returns_list(self, all_countries):
+        assert isinstance(all_countries, list)
 
-    def test_not_empty(self):
-        countries = get_all_countries()
-        assert len(countries) > 0
+    def test_not_empty(self, all_countries):
+        assert len(all_countries) > 0
 
-    def test_has_at_least_190_countries(self):
-        countries = get_all_countries()
-        assert len(countries) >= 190
+    def test_has_at_least_190_countries(self, all_countries):
+        assert len(all_countries) >= 190
 
-    def test_all_items_are_country_instances(self):
-        countries = get_all_countries()
-        for country in countries:
-            assert isinstance(country, Country)
+    def test_all_items_are_country_instances(self, all_countries):
+        assert all(isinstance(c, Country) for c in all_countries)
 
     def test_returns_copy(self):
         countries1 = get_all_countries()
         countries2 = get_all_countries()
         assert countries1 is not countries2
 
-    def test_all_countries_have_valid_latitude(self):
-        for country in get_all_countries():
-            assert -90 <= country.latitude <= 90, f"{country.name} has invalid latitude"
-
-    def test_all_countries_have_valid_longitude(self):
-        for country in get_all_countries():
-            assert -180 <= country.longitude <= 180, f"{country.name} has invalid longitude"
-
-    def test_all_countries_have_nonempty_fields(self):
-        for country in get_all_countries():
-            assert country.name, "Country has empty name"
-            assert country.capital, f"{country.name} has empty capital"
-            assert country.continent, f"{country.name} has empty continent"
-
-    def test_no_duplicate_country_names(self):
-        countries = get_all_countries()
-        names = [c.name for c in countries]
-        assert len(names) == len(set(names))
+    @pytest.mark.slow
+    def test_all_countries_are_valid(self, all_countries):
+        invalid = [
+            c
+            for c in all_countries
+            if not (
+                -90 <= c.latitude <= 90
+                and -180 <= c.longitude <= 180
+                and c.name
+                and c.capital
+                and c.continent
+            )
+        ]
+        assert not invalid, invalid
+
+    def test_no_duplicate_country_names(self, all_countries, country_index):
+        assert len(country_index) == len(all_countries)
 
 
 class TestGetCountryByName:
-    def test_find_existing_country(self):
-        country = get_country_by_name("India")
-        assert country is not None
-        assert country.name == "India"
-        assert country.capital == "New Delhi"
-
-    def test_find_country_case_insensitive(self):
-        country = get_country_by_name("india")
-        assert country is not None
-        assert country.name == "India"
-
-    def test_find_country_uppercase(self):
-        country = get_country_by_name("JAPAN")
-        assert country is not None
-        assert country.name == "Japan"
-
-    def test_find_nonexistent_country(self):
-        country = get_country_by_name("Atlantis")
-        assert country is None
-
-    def test_find_empty_string(self):
-        country = get_country_by_name("")
-        assert country is None
-
-    def test_find_united_states(self):
-        country = get_country_by_name("United States")
+    @pytest.mark.parametrize(
+        "name,expected_name,expected_capital",
+        [
+            ("India", "India", "New Delhi"),
+            ("india", "India", "New Delhi"),
+            ("JAPAN", "Japan", "Tokyo"),
+            ("United States", "United States", "Washington D.C."),
+            ("United Kingdom", "United Kingdom", "London"),
+            ("Cabo Verde", "Cabo Verde", "Praia"),
+        ],
+        ids=["india", "india_lower", "japan_upper", "us", "uk", "cabo_verde"],
+    )
+    def test_find_country(self, name, expected_name, expected_capital):
+        country = get_country_by_name(name)
         assert country is not None
-        assert country.capital == "Washington D.C."
+        assert country.name == expected_name
+        assert country.capital == expected_capital
 
-    def test_find_united_kingdom(self):
-        country = get_country_by_name("United Kingdom")
-        assert country is not None
-        assert country.capital == "London"
-
-    def test_find_country_with_special_characters(self):
-        country = get_country_by_name("Cabo Verde")
-        assert country is not None
-        assert country.capital == "Praia"
+    @pytest.mark.parametrize("name", ["Atlantis", ""], ids=["unknown", "empty"])
+    def test_find_missing_country(self, name):
+        assert get_country_by_name(name) is None
 
 
 class TestGetCountriesByContinent:
-    def test_get_european_countries(self):
-        countries = get_countries_by_continent("Europe")
-        assert len(countries) > 0
-        for c in countries:
-            assert c.continent == "Europe"
-
-    def test_get_african_countries(self):
-        countries = get_countries_by_continent("Africa")
-        assert len(countries) > 0
-        for c in countries:
-            assert c.continent == "Africa"
-
-    def test_case_insensitive(self):
-        countries = get_countries_by_continent("asia")
-        assert len(countries) > 0
-        for c in countries:
-            assert c.continent == "Asia"
+    @pytest.mark.parametrize(
+        "name,expected",
+        [("Europe", "Europe"), ("Africa", "Africa"), ("asia", "Asia")],
+        ids=["europe", "africa", "asia_lower"],
+    )
+    def test_get_countries(self, name, expected):
+        countries = get_countries_by_continent(name)
+        assert {c.continent for c in countries} == {expected}
 
     def test_nonexistent_continent(self):
         countries = get_countries_by_continent("Narnia")
         assert countries == []
 
-    def test_all_continents_have_countries(self):
-        continents = get_all_continents()
-        for continent in continents:
-            countries = get_countries_by_continent(continent)
-            assert len(countries) > 0, f"{continent} has no countries"
+    def test_returns_copy(self):
+        countries = get_countries_by_continent("Europe")
+        countries.clear()
+        assert get_countries_by_continent("Europe")
+
+    def test_all_continents_have_countries(self, continent_counts):
+        empty = [c for c in get_all_continents() if not continent_counts[c]]
+        assert not empty, f"{empty} have no countries"
 
-    def test_total_by_continent_equals_all(self):
-        total = sum(len(get_countries_by_continent(c)) for c in get_all_continents())
-        assert total == len(get_all_countries())
+    def test_total_by_continent_equals_all(self, all_countries, continent_counts):
+        total = sum(continent_counts[c] for c in get_all_continents())
+        assert total == len(all_countries)
 
 
 class TestGetAllContinents:
@@ -164,10 +152,11 @@ class TestGetAllContinents:
         assert continents == sorted(continents)
 
     def test_known_continents_present(self):
-        continents = get_all_continents()
-        expected = ["Africa", "Asia", "Europe", "North America", "Oceania", "South America"]
-        for exp in expected:
-            assert exp in continents
+        expected = {"Africa", "Asia", "Europe", "North America", "Oceania", "South America"}
+        assert expected <= set(get_all_continents())
+
+    def test_returns_copy(self):
+        assert get_all_continents() is not get_all_continents()
 
     def test_no_duplicates(self):
         continents = get_all_continents()
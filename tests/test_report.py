@@ -1,12 +1,21 @@
 """Unit tests for the report module."""
 
+import io
+from unittest.mock import patch
+
+from weather_report.cache import DiskCache
 from weather_report.report import (
+    compute_report_stats,
+    continent_summary_lines,
+    extremes_lines,
     find_extremes,
     format_continent_summary,
     format_extremes,
     format_single_report,
     format_summary_table,
     generate_full_report,
+    summary_table_lines,
+    write_full_report,
 )
 from weather_report.weather_service import WeatherCondition, WeatherData
 
@@ -25,7 +34,6 @@ def make_weather(
         capital=capital,
         continent=continent,
         temperature_celsius=temp_c,
-        temperature_fahrenheit=(temp_c * 9 / 5) + 32,
         humidity=humidity,
         wind_speed_kmh=wind,
         condition=condition,
@@ -105,6 +113,12 @@ class TestFormatSummaryTable:
         table = format_summary_table(weather_list)
         assert "---" in table
 
+    def test_lines_one_per_row(self):
+        weather_list = [make_weather(country="India"), make_weather(country="Japan")]
+        lines = summary_table_lines(weather_list)
+        assert len(lines) == 4
+        assert "\n".join(lines) == format_summary_table(weather_list)
+
 
 class TestFormatContinentSummary:
     def test_single_continent(self):
@@ -142,6 +156,21 @@ class TestFormatContinentSummary:
         assert "10.0" in summary
         assert "30.0" in summary
 
+    def test_lines_one_per_element(self):
+        weather_list = [make_weather(continent="Asia"), make_weather(continent="Europe")]
+        lines = continent_summary_lines(weather_list)
+        assert len(lines) == 12
+        assert not any("\n" in line for line in lines)
+        assert "\n".join(lines) == format_continent_summary(weather_list)
+
+    def test_avg_humidity(self):
+        weather_list = [
+            make_weather(continent="Asia", humidity=40),
+            make_weather(continent="Asia", humidity=80),
+        ]
+        summary = format_continent_summary(weather_list)
+        assert "Avg Humidity    : 60%" in summary
+
 
 class TestGenerateFullReport:
     def test_contains_header(self):
@@ -175,6 +204,86 @@ class TestGenerateFullReport:
         assert "WORLD WEATHER REPORT" in report
         assert "0" in report
 
+    def test_cached_report_reused(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=600)
+        weather_list = [make_weather(country="India")]
+        with patch("weather_report.report._build_full_report", return_value="REPORT") as build:
+            assert generate_full_report(weather_list, cache) == "REPORT"
+            assert generate_full_report(weather_list, cache) == "REPORT"
+        build.assert_called_once()
+
+    def test_changed_data_overwrites_entry(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=600)
+        generate_full_report([make_weather(temp_c=10.0)], cache)
+        report = generate_full_report([make_weather(temp_c=30.0)], cache)
+        assert "30.0" in report
+        assert [p.name for p in tmp_path.glob("report-*.json")] == ["report-all.json"]
+
+    def test_named_reports_cached_separately(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=600)
+        generate_full_report([make_weather(continent="Asia")], cache, name="continent-asia")
+        generate_full_report([make_weather()], cache)
+        assert len(list(tmp_path.glob("report-*.json"))) == 2
+
+    def test_zero_ttl_cache(self, tmp_path):
+        report = generate_full_report([], DiskCache(tmp_path, ttl=0))
+        assert "WORLD WEATHER REPORT" in report
+
+
+class TestWriteFullReport:
+    @patch("weather_report.report.datetime")
+    def test_matches_generated_report(self, mock_datetime):
+        mock_datetime.now.return_value.strftime.return_value = "2024-01-01 00:00:00 UTC"
+        weather_list = [make_weather(country="India"), make_weather(country="Japan")]
+        out = io.StringIO()
+        write_full_report(weather_list, out)
+        assert out.getvalue() == generate_full_report(weather_list)
+
+    def test_no_trailing_newline(self):
+        out = io.StringIO()
+        write_full_report([], out)
+        assert not out.getvalue().endswith("\n")
+
+
+class TestComputeReportStats:
+    def test_continent_groups(self):
+        weather_list = [
+            make_weather(continent="Asia", temp_c=10.0, humidity=40),
+            make_weather(continent="Europe", temp_c=5.0, humidity=70),
+            make_weather(continent="Asia", temp_c=30.0, humidity=60),
+        ]
+        stats = compute_report_stats(weather_list)
+        asia = stats.continents["Asia"]
+        assert asia.count == 2
+        assert asia.temp_sum == 40.0
+        assert asia.temp_min == 10.0
+        assert asia.temp_max == 30.0
+        assert asia.humidity_sum == 100
+        assert asia.temp_avg == 20.0
+        assert asia.humidity_avg == 50.0
+        assert stats.continents["Europe"].count == 1
+
+    def test_extremes_match_find_extremes(self):
+        weather_list = [
+            make_weather(country="Cold", temp_c=-10.0, wind=80.0),
+            make_weather(country="Hot", temp_c=45.0, humidity=95),
+        ]
+        stats = compute_report_stats(weather_list)
+        assert stats.extremes == find_extremes(weather_list)
+
+    def test_precomputed_stats_reused(self):
+        weather_list = [
+            make_weather(country="A", continent="Asia", temp_c=10.0),
+            make_weather(country="B", continent="Europe", temp_c=20.0),
+        ]
+        stats = compute_report_stats(weather_list)
+        with patch("weather_report.report.compute_report_stats") as mock_compute:
+            summary = format_continent_summary(weather_list, stats)
+            extremes = format_extremes(weather_list, stats)
+        mock_compute.assert_not_called()
+        assert summary == format_continent_summary(weather_list)
+        assert extremes == format_extremes(weather_list)
+
 
 class TestFindExtremes:
     def test_hottest(self):
@@ -229,6 +338,25 @@ class TestFindExtremes:
         assert extremes["coldest"] is not None
         assert extremes["coldest"].country == "Only"
 
+    def test_ties_keep_first_entry(self):
+        weather_list = [
+            make_weather(country="First", temp_c=30.0, humidity=80, wind=20.0),
+            make_weather(country="Second", temp_c=30.0, humidity=80, wind=20.0),
+        ]
+        extremes = find_extremes(weather_list)
+        assert {w.country for w in extremes.values()} == {"First"}
+
+
+class TestExtremesLines:
+    def test_empty_list(self):
+        assert extremes_lines([]) == ["No data available for extremes."]
+
+    def test_one_line_per_extreme(self):
+        lines = extremes_lines([make_weather(country="Only")])
+        assert len(lines) == 7
+        assert not any("\n" in line for line in lines)
+        assert "\n".join(lines) == format_extremes([make_weather(country="Only")])
+
 
 class TestFormatExtremes:
     def test_contains_hottest(self):
@@ -1,20 +1,31 @@
 """Unit tests for the weather service module."""
 
-from unittest.mock import MagicMock, patch
+import dataclasses
+import json
+import time
+from unittest.mock import MagicMock
 
 import pytest
+import requests
 
+from weather_report.cache import DiskCache
 from weather_report.countries import Country
 from weather_report.weather_service import (
+    WMO_CODE_MAP,
     WeatherCondition,
     WeatherData,
     WeatherServiceError,
     celsius_to_fahrenheit,
+    close_session,
     fetch_weather,
     fetch_weather_batch,
+    fetch_weather_bulk,
     interpret_weather_code,
+    invalidate_weather_cache,
 )
 
+SESSION_GET = "weather_report.weather_service._SESSION.get"
+
 SAMPLE_COUNTRY = Country("TestLand", "TestCity", 10.0, 20.0, "TestContinent")
 
 SAMPLE_API_RESPONSE = {
@@ -27,6 +38,52 @@ SAMPLE_API_RESPONSE = {
 }
 
 
+def make_response(payload: dict | list, headers: dict | None = None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = headers or {}
+    response.json.return_value = payload
+    response.content = json.dumps(payload).encode()
+    response.raise_for_status.return_value = None
+    return response
+
+
+def make_countries(count: int) -> list[Country]:
+    return [
+        Country(f"Land{i}", f"City{i}", float(i), float(i), "TestContinent") for i in range(count)
+    ]
+
+
+def bulk_get(url, params, timeout):
+    latitudes = params["latitude"].split(",")
+    payload = [
+        {
+            "current": {
+                "temperature_2m": float(lat),
+                "relative_humidity_2m": 60,
+                "weather_code": 0,
+                "wind_speed_10m": 15.5,
+            }
+        }
+        for lat in latitudes
+    ]
+    return make_response(payload[0] if len(payload) == 1 else payload)
+
+
+@pytest.fixture(autouse=True)
+def clear_weather_cache():
+    invalidate_weather_cache()
+    yield
+    invalidate_weather_cache()
+
+
+@pytest.fixture
+def mock_get(monkeypatch):
+    get = MagicMock()
+    monkeypatch.setattr(SESSION_GET, get)
+    return get
+
+
 class TestCelsiusToFahrenheit:
     def test_zero(self):
         assert celsius_to_fahrenheit(0) == 32.0
@@ -88,6 +145,14 @@ class TestInterpretWeatherCode:
     def test_negative_code(self):
         assert interpret_weather_code(-1) == WeatherCondition.UNKNOWN
 
+    def test_first_code_past_table(self):
+        assert interpret_weather_code(100) == WeatherCondition.UNKNOWN
+
+    def test_matches_code_map(self):
+        for code in range(100):
+            expected = WMO_CODE_MAP.get(code, WeatherCondition.UNKNOWN)
+            assert interpret_weather_code(code) == expected
+
 
 class TestWeatherData:
     def test_creation(self):
@@ -96,7 +161,6 @@ class TestWeatherData:
             capital="TestCity",
             continent="TestContinent",
             temperature_celsius=25.0,
-            temperature_fahrenheit=77.0,
             humidity=60,
             wind_speed_kmh=15.5,
             condition=WeatherCondition.CLEAR,
@@ -106,13 +170,27 @@ class TestWeatherData:
         assert data.temperature_celsius == 25.0
         assert data.humidity == 60
 
+    def test_is_frozen(self):
+        data = WeatherData(
+            country="TestLand",
+            capital="TestCity",
+            continent="TestContinent",
+            temperature_celsius=25.0,
+            humidity=60,
+            wind_speed_kmh=15.5,
+            condition=WeatherCondition.CLEAR,
+            weather_code=0,
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            data.humidity = 10
+        assert not hasattr(data, "__dict__")
+
     def test_temperature_display(self):
         data = WeatherData(
             country="TestLand",
             capital="TestCity",
             continent="TestContinent",
             temperature_celsius=25.0,
-            temperature_fahrenheit=77.0,
             humidity=60,
             wind_speed_kmh=15.5,
             condition=WeatherCondition.CLEAR,
@@ -126,7 +204,6 @@ class TestWeatherData:
             capital="TestCity",
             continent="TestContinent",
             temperature_celsius=-10.5,
-            temperature_fahrenheit=13.1,
             humidity=80,
             wind_speed_kmh=20.0,
             condition=WeatherCondition.SNOW,
@@ -134,14 +211,24 @@ class TestWeatherData:
         )
         assert data.temperature_display == "-10.5°C / 13.1°F"
 
+    def test_fahrenheit_derived_from_celsius(self):
+        data = WeatherData(
+            country="TestLand",
+            capital="TestCity",
+            continent="TestContinent",
+            temperature_celsius=100.0,
+            humidity=60,
+            wind_speed_kmh=15.5,
+            condition=WeatherCondition.CLEAR,
+            weather_code=0,
+        )
+        assert data.temperature_fahrenheit == 212.0
+        assert "temperature_fahrenheit" not in {f.name for f in dataclasses.fields(data)}
+
 
 class TestFetchWeather:
-    @patch("weather_report.weather_service.requests.get")
     def test_successful_fetch(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.json.return_value = SAMPLE_API_RESPONSE
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(SAMPLE_API_RESPONSE)
 
         result = fetch_weather(SAMPLE_COUNTRY)
 
@@ -153,12 +240,8 @@ class TestFetchWeather:
         assert result.wind_speed_kmh == 15.5
         assert result.condition == WeatherCondition.CLEAR
 
-    @patch("weather_report.weather_service.requests.get")
     def test_api_call_parameters(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.json.return_value = SAMPLE_API_RESPONSE
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(SAMPLE_API_RESPONSE)
 
         fetch_weather(SAMPLE_COUNTRY)
 
@@ -167,48 +250,44 @@ class TestFetchWeather:
         assert call_args.kwargs["params"]["latitude"] == 10.0
         assert call_args.kwargs["params"]["longitude"] == 20.0
 
-    @patch("weather_report.weather_service.requests.get")
     def test_network_error_raises(self, mock_get):
-        from requests.exceptions import ConnectionError
-
-        mock_get.side_effect = ConnectionError("Network error")
+        mock_get.side_effect = requests.ConnectionError("Network error")
 
         with pytest.raises(WeatherServiceError) as exc_info:
             fetch_weather(SAMPLE_COUNTRY)
         assert "TestLand" in str(exc_info.value)
 
-    @patch("weather_report.weather_service.requests.get")
     def test_http_error_raises(self, mock_get):
-        from requests.exceptions import HTTPError
-
         mock_response = MagicMock()
-        mock_response.raise_for_status.side_effect = HTTPError("500 Server Error")
+        mock_response.raise_for_status.side_effect = requests.HTTPError("500 Server Error")
         mock_get.return_value = mock_response
 
         with pytest.raises(WeatherServiceError):
             fetch_weather(SAMPLE_COUNTRY)
 
-    @patch("weather_report.weather_service.requests.get")
     def test_invalid_json_raises(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.raise_for_status.return_value = None
+        mock_response = make_response({})
+        mock_response.content = b"not json"
         mock_response.json.side_effect = ValueError("Invalid JSON")
         mock_get.return_value = mock_response
 
         with pytest.raises(WeatherServiceError):
             fetch_weather(SAMPLE_COUNTRY)
 
-    @patch("weather_report.weather_service.requests.get")
     def test_missing_key_raises(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"unexpected": "data"}
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response({"unexpected": "data"})
 
         with pytest.raises(WeatherServiceError):
             fetch_weather(SAMPLE_COUNTRY)
 
-    @patch("weather_report.weather_service.requests.get")
+    def test_stdlib_json_fallback(self, mock_get, monkeypatch):
+        monkeypatch.setattr("weather_report.weather_service.orjson", None)
+        mock_get.return_value = make_response(SAMPLE_API_RESPONSE)
+
+        result = fetch_weather(SAMPLE_COUNTRY)
+        assert result.temperature_celsius == 25.0
+        mock_get.return_value.json.assert_called_once()
+
     def test_rain_condition(self, mock_get):
         rain_response = {
             "current": {
@@ -218,15 +297,11 @@ class TestFetchWeather:
                 "wind_speed_10m": 25.0,
             }
         }
-        mock_response = MagicMock()
-        mock_response.json.return_value = rain_response
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(rain_response)
 
         result = fetch_weather(SAMPLE_COUNTRY)
         assert result.condition == WeatherCondition.RAIN
 
-    @patch("weather_report.weather_service.requests.get")
     def test_snow_condition(self, mock_get):
         snow_response = {
             "current": {
@@ -236,69 +311,295 @@ class TestFetchWeather:
                 "wind_speed_10m": 10.0,
             }
         }
-        mock_response = MagicMock()
-        mock_response.json.return_value = snow_response
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(snow_response)
 
         result = fetch_weather(SAMPLE_COUNTRY)
         assert result.condition == WeatherCondition.SNOW
         assert result.temperature_celsius == -5.0
 
 
-class TestFetchWeatherBatch:
-    @patch("weather_report.weather_service.fetch_weather")
-    def test_batch_success(self, mock_fetch):
-        mock_fetch.return_value = WeatherData(
-            country="TestLand",
-            capital="TestCity",
-            continent="TestContinent",
-            temperature_celsius=25.0,
-            temperature_fahrenheit=77.0,
-            humidity=60,
-            wind_speed_kmh=15.5,
-            condition=WeatherCondition.CLEAR,
-            weather_code=0,
+MALFORMED_VALUES = [{"temperature_2m": None}, {}, [1, 2, 3]]
+MALFORMED_IDS = ["null_field", "empty", "list"]
+
+
+def write_cache_entry(directory, key, value, stored_at=None, validators=None):
+    entry = {"stored_at": time.time() if stored_at is None else stored_at, "value": value}
+    if validators:
+        entry["validators"] = validators
+    (directory / f"{key}.json").write_text(json.dumps(entry), encoding="utf-8")
+
+
+class TestFetchWeatherCache:
+    @pytest.mark.parametrize("value", MALFORMED_VALUES, ids=MALFORMED_IDS)
+    def test_malformed_entry_refetched(self, mock_get, tmp_path, value):
+        write_cache_entry(tmp_path, "weather-10.0_20.0", value)
+        mock_get.return_value = make_response(SAMPLE_API_RESPONSE)
+        cache = DiskCache(tmp_path, ttl=60)
+
+        result = fetch_weather(SAMPLE_COUNTRY, cache)
+
+        assert result.temperature_celsius == 25.0
+        assert cache.get("weather-10.0_20.0") == SAMPLE_API_RESPONSE["current"]
+
+    def test_malformed_stale_entry_not_revalidated(self, mock_get, tmp_path):
+        write_cache_entry(
+            tmp_path, "weather-10.0_20.0", {}, stored_at=0.0, validators={"etag": '"abc"'}
         )
+        mock_get.return_value = make_response(SAMPLE_API_RESPONSE)
 
-        countries = [SAMPLE_COUNTRY, SAMPLE_COUNTRY]
-        results = fetch_weather_batch(countries)
-        assert len(results) == 2
+        result = fetch_weather(SAMPLE_COUNTRY, DiskCache(tmp_path, ttl=60))
 
-    @patch("weather_report.weather_service.fetch_weather")
-    def test_batch_skip_errors(self, mock_fetch):
-        mock_fetch.side_effect = [
-            WeatherData(
-                country="TestLand",
-                capital="TestCity",
-                continent="TestContinent",
-                temperature_celsius=25.0,
-                temperature_fahrenheit=77.0,
-                humidity=60,
-                wind_speed_kmh=15.5,
-                condition=WeatherCondition.CLEAR,
-                weather_code=0,
-            ),
-            WeatherServiceError("API error"),
-        ]
+        assert mock_get.call_args.kwargs["headers"] == {}
+        assert result.temperature_celsius == 25.0
+
+    def test_malformed_response_raises_service_error(self, mock_get):
+        mock_get.return_value = make_response({"current": {"temperature_2m": None}})
+        with pytest.raises(WeatherServiceError):
+            fetch_weather(SAMPLE_COUNTRY)
 
-        countries = [SAMPLE_COUNTRY, SAMPLE_COUNTRY]
-        results = fetch_weather_batch(countries, on_error="skip")
+    def test_cache_miss_stores_response(self, mock_get, tmp_path):
+        mock_get.return_value = make_response(SAMPLE_API_RESPONSE)
+        cache = DiskCache(tmp_path, ttl=60)
+
+        fetch_weather(SAMPLE_COUNTRY, cache)
+
+        assert cache.get("weather-10.0_20.0") == SAMPLE_API_RESPONSE["current"]
+
+    def test_cache_hit_skips_request(self, mock_get, tmp_path):
+        cache = DiskCache(tmp_path, ttl=60)
+        cache.set("weather-10.0_20.0", SAMPLE_API_RESPONSE["current"])
+
+        result = fetch_weather(SAMPLE_COUNTRY, cache)
+
+        mock_get.assert_not_called()
+        assert result.temperature_celsius == 25.0
+
+    def test_stores_validators(self, mock_get, tmp_path):
+        mock_get.return_value = make_response(SAMPLE_API_RESPONSE, headers={"ETag": '"abc"'})
+        cache = DiskCache(tmp_path, ttl=60)
+
+        fetch_weather(SAMPLE_COUNTRY, cache)
+
+        assert cache.get_stale("weather-10.0_20.0")[1] == {"etag": '"abc"'}
+
+    def test_expired_entry_revalidated(self, mock_get, tmp_path):
+        not_modified = make_response({})
+        not_modified.status_code = 304
+        mock_get.return_value = not_modified
+        cache = DiskCache(tmp_path, ttl=0)
+        cache.set("weather-10.0_20.0", SAMPLE_API_RESPONSE["current"], {"etag": '"abc"'})
+
+        result = fetch_weather(SAMPLE_COUNTRY, cache)
+
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+        not_modified.json.assert_not_called()
+        assert result.temperature_celsius == 25.0
+        assert cache.get_stale("weather-10.0_20.0")[1] == {"etag": '"abc"'}
+
+    def test_changed_entry_replaced(self, mock_get, tmp_path):
+        changed = {"current": {**SAMPLE_API_RESPONSE["current"], "temperature_2m": 30.0}}
+        mock_get.return_value = make_response(changed, headers={"ETag": '"def"'})
+        cache = DiskCache(tmp_path, ttl=0)
+        cache.set("weather-10.0_20.0", SAMPLE_API_RESPONSE["current"], {"etag": '"abc"'})
+
+        result = fetch_weather(SAMPLE_COUNTRY, cache)
+
+        assert result.temperature_celsius == 30.0
+        assert cache.get_stale("weather-10.0_20.0") == (changed["current"], {"etag": '"def"'})
+
+
+class TestInMemoryWeatherCache:
+    def test_disk_hit_keeps_its_age(self, mock_get, tmp_path):
+        cache = DiskCache(tmp_path, ttl=600)
+        entry = {"stored_at": time.time() - 400, "value": SAMPLE_API_RESPONSE["current"]}
+        (tmp_path / "weather-10.0_20.0.json").write_text(json.dumps(entry), encoding="utf-8")
+        mock_get.return_value = make_response(SAMPLE_API_RESPONSE)
+
+        fetch_weather(SAMPLE_COUNTRY, cache)
+        fetch_weather(SAMPLE_COUNTRY)
+
+        mock_get.assert_called_once()
+
+    def test_repeat_fetch_served_from_memory(self, mock_get):
+        mock_get.return_value = make_response(SAMPLE_API_RESPONSE)
+
+        first = fetch_weather(SAMPLE_COUNTRY)
+        second = fetch_weather(SAMPLE_COUNTRY)
+
+        assert first is second
+        mock_get.assert_called_once()
+
+    def test_invalidate_forces_refetch(self, mock_get):
+        mock_get.return_value = make_response(SAMPLE_API_RESPONSE)
+
+        fetch_weather(SAMPLE_COUNTRY)
+        invalidate_weather_cache()
+        fetch_weather(SAMPLE_COUNTRY)
+
+        assert mock_get.call_count == 2
+
+    def test_expired_entry_refetched(self, mock_get, monkeypatch):
+        monkeypatch.setattr("weather_report.weather_service.WEATHER_CACHE_TTL", 0.0)
+        mock_get.return_value = make_response(SAMPLE_API_RESPONSE)
+
+        fetch_weather(SAMPLE_COUNTRY)
+        fetch_weather(SAMPLE_COUNTRY)
+
+        assert mock_get.call_count == 2
+
+    def test_least_recently_used_entry_evicted(self, mock_get, monkeypatch):
+        monkeypatch.setattr("weather_report.weather_service.WEATHER_CACHE_MAX_ENTRIES", 1)
+        mock_get.return_value = make_response(SAMPLE_API_RESPONSE)
+        other = Country("OtherLand", "OtherCity", 30.0, 40.0, "TestContinent")
+
+        fetch_weather(SAMPLE_COUNTRY)
+        fetch_weather(other)
+        fetch_weather(SAMPLE_COUNTRY)
+
+        assert mock_get.call_count == 3
+
+
+class TestCloseSession:
+    def test_closes_shared_session(self, monkeypatch):
+        close = MagicMock()
+        monkeypatch.setattr("weather_report.weather_service._SESSION.close", close)
+        close_session()
+        close.assert_called_once()
+
+
+class TestFetchWeatherBulk:
+    def test_single_request_for_many_countries(self, mock_get):
+        mock_get.side_effect = bulk_get
+        countries = make_countries(3)
+
+        results = fetch_weather_bulk(countries)
+
+        mock_get.assert_called_once()
+        params = mock_get.call_args.kwargs["params"]
+        assert params["latitude"] == "0.0,1.0,2.0"
+        assert params["longitude"] == "0.0,1.0,2.0"
+        assert [w.temperature_celsius for w in results] == [0.0, 1.0, 2.0]
+
+    def test_single_location_object_response(self, mock_get):
+        mock_get.return_value = make_response(SAMPLE_API_RESPONSE)
+        results = fetch_weather_bulk([SAMPLE_COUNTRY])
         assert len(results) == 1
+        assert results[0].country == "TestLand"
+
+    def test_chunks_requests(self, mock_get, monkeypatch):
+        monkeypatch.setattr("weather_report.weather_service.BULK_CHUNK_SIZE", 10)
+        mock_get.side_effect = bulk_get
+        countries = make_countries(25)
+
+        results = fetch_weather_bulk(countries)
+
+        assert mock_get.call_count == 3
+        assert [w.country for w in results] == [c.name for c in countries]
+
+    def test_cached_countries_not_requested(self, mock_get):
+        mock_get.side_effect = bulk_get
+        countries = make_countries(3)
+        fetch_weather_bulk(countries[:2])
+
+        results = fetch_weather_bulk(countries)
+
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["params"]["latitude"] == "2.0"
+        assert [w.country for w in results] == [c.name for c in countries]
+
+    def test_location_count_mismatch(self, mock_get):
+        mock_get.return_value = make_response([SAMPLE_API_RESPONSE])
+        with pytest.raises(WeatherServiceError):
+            fetch_weather_bulk(make_countries(2), on_error="raise")
+
+    def test_keeps_stored_validators(self, mock_get, tmp_path):
+        mock_get.side_effect = bulk_get
+        cache = DiskCache(tmp_path, ttl=0)
+        cache.set("weather-0.0_0.0", SAMPLE_API_RESPONSE["current"], {"etag": '"abc"'})
+
+        fetch_weather_bulk(make_countries(2), cache=cache)
 
-    @patch("weather_report.weather_service.fetch_weather")
-    def test_batch_raise_errors(self, mock_fetch):
-        mock_fetch.side_effect = WeatherServiceError("API error")
+        assert cache.get_stale("weather-0.0_0.0")[1] == {"etag": '"abc"'}
+        assert cache.get_stale("weather-1.0_1.0")[1] == {}
 
-        countries = [SAMPLE_COUNTRY]
+    @pytest.mark.parametrize("value", MALFORMED_VALUES, ids=MALFORMED_IDS)
+    def test_malformed_cache_entry_refetched(self, mock_get, tmp_path, value):
+        write_cache_entry(tmp_path, "weather-0.0_0.0", value)
+        mock_get.side_effect = bulk_get
+        cache = DiskCache(tmp_path, ttl=60)
+
+        results = fetch_weather_bulk(make_countries(2), cache=cache)
+
+        assert [w.country for w in results] == ["Land0", "Land1"]
+        assert mock_get.call_args.kwargs["params"]["latitude"] == "0.0,1.0"
+        assert cache.get("weather-0.0_0.0")["temperature_2m"] == 0.0
+
+    def test_malformed_location_skipped(self, mock_get, tmp_path):
+        payload = [
+            {"current": {**SAMPLE_API_RESPONSE["current"], "temperature_2m": float(i)}}
+            for i in range(5)
+        ]
+        payload[1]["current"]["temperature_2m"] = None
+        payload[3] = {"error": True}
+        mock_get.return_value = make_response(payload)
+        countries = make_countries(5)
+        cache = DiskCache(tmp_path, ttl=60)
+
+        first = fetch_weather_bulk(countries, cache=cache)
+        second = fetch_weather_bulk(countries, cache=cache)
+
+        assert [w.country for w in first] == ["Land0", "Land2", "Land4"]
+        assert second == first
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["params"]["latitude"] == "1.0,3.0"
+
+    def test_malformed_location_raises(self, mock_get):
+        payload = [SAMPLE_API_RESPONSE, {"current": {"temperature_2m": None}}]
+        mock_get.return_value = make_response(payload)
+        with pytest.raises(WeatherServiceError, match="Land1"):
+            fetch_weather_bulk(make_countries(2), on_error="raise")
+
+    def test_empty_list(self, mock_get):
+        assert fetch_weather_bulk([]) == []
+        mock_get.assert_not_called()
+
+
+class TestFetchWeatherBatch:
+    def test_batch_success(self, mock_get):
+        mock_get.side_effect = bulk_get
+        results = fetch_weather_batch(make_countries(2))
+        assert len(results) == 2
+
+    def test_batch_skip_errors(self, mock_get, monkeypatch):
+        monkeypatch.setattr("weather_report.weather_service.BULK_CHUNK_SIZE", 1)
+
+        def flaky_get(url, params, timeout):
+            if params["latitude"] == "1.0":
+                raise requests.ConnectionError("API error")
+            return bulk_get(url, params, timeout)
+
+        mock_get.side_effect = flaky_get
+        results = fetch_weather_batch(make_countries(3), on_error="skip")
+        assert [w.country for w in results] == ["Land0", "Land2"]
+
+    def test_batch_raise_errors(self, mock_get):
+        mock_get.side_effect = requests.ConnectionError("API error")
         with pytest.raises(WeatherServiceError):
-            fetch_weather_batch(countries, on_error="raise")
+            fetch_weather_batch([SAMPLE_COUNTRY], on_error="raise")
+
+    def test_batch_uses_disk_cache(self, mock_get, tmp_path):
+        cache = DiskCache(tmp_path, ttl=60)
+        cache.set("weather-10.0_20.0", SAMPLE_API_RESPONSE["current"])
+
+        results = fetch_weather_batch([SAMPLE_COUNTRY], cache=cache)
+
+        mock_get.assert_not_called()
+        assert results[0].temperature_celsius == 25.0
 
-    @patch("weather_report.weather_service.fetch_weather")
-    def test_batch_empty_list(self, mock_fetch):
+    def test_batch_empty_list(self, mock_get):
         results = fetch_weather_batch([])
         assert results == []
-        mock_fetch.assert_not_called()
+        mock_get.assert_not_called()
 
 
 class TestWeatherConditionEnum:
@@ -0,0 +1,73 @@
+"""On-disk cache for weather API responses and generated reports."""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "weather_report"
+CACHE_TTL = 600
+
+
+class DiskCache:
+    def __init__(self, directory: Path, ttl: float) -> None:
+        self.directory = directory
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _read(self, key: str) -> dict | None:
+        try:
+            entry = json.loads(self._path(key).read_text(encoding="utf-8"))
+            entry["stored_at"] = float(entry["stored_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return entry if "value" in entry else None
+
+    def get(self, key: str) -> Any | None:
+        hit = self.get_with_age(key)
+        return None if hit is None else hit[0]
+
+    def get_with_age(self, key: str) -> tuple[Any, float] | None:
+        entry = self._read(key)
+        if entry is None:
+            return None
+        age = max(time.time() - entry["stored_at"], 0.0)
+        if age >= self.ttl:
+            return None
+        return entry["value"], age
+
+    def get_stale(self, key: str) -> tuple[Any, dict[str, str]] | None:
+        # Expired entries are still returned along with the HTTP validators
+        # they were stored with, so the caller can revalidate them.
+        entry = self._read(key)
+        if entry is None:
+            return None
+        validators = entry.get("validators")
+        return entry["value"], validators if isinstance(validators, dict) else {}
+
+    def set(self, key: str, value: Any, validators: dict[str, str] | None = None) -> None:
+        entry = {"stored_at": time.time(), "value": value}
+        if validators:
+            entry["validators"] = validators
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, TypeError, ValueError):
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def create_cache() -> DiskCache:
+    return DiskCache(CACHE_DIR, CACHE_TTL)
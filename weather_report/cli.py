@@ -2,23 +2,19 @@
 
 import argparse
 import sys
+from collections import Counter
+from typing import TYPE_CHECKING
 
+from weather_report.cache import DiskCache, create_cache
 from weather_report.countries import (
     get_all_continents,
     get_all_countries,
     get_countries_by_continent,
     get_country_by_name,
 )
-from weather_report.report import (
-    format_extremes,
-    format_single_report,
-    generate_full_report,
-)
-from weather_report.weather_service import (
-    WeatherServiceError,
-    fetch_weather,
-    fetch_weather_batch,
-)
+
+if TYPE_CHECKING:
+    from weather_report.weather_service import WeatherData
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -26,6 +22,14 @@ def build_parser() -> argparse.ArgumentParser:
         prog="weather-report",
         description="Generate weather reports for countries around the world.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=(
+            "Bypass the on-disk weather and report cache; reports are then streamed "
+            "to stdout as they are written instead of being built in memory first"
+        ),
+    )
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     subparsers.add_parser("all", help="Get weather report for all countries")
@@ -44,16 +48,39 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def cmd_all() -> int:
+def _print_full_report(
+    weather_list: "list[WeatherData]", cache: DiskCache | None, name: str
+) -> None:
+    from weather_report.report import (
+        compute_report_stats,
+        format_extremes,
+        generate_full_report,
+        write_full_report,
+    )
+
+    stats = compute_report_stats(weather_list)
+    if cache is None:
+        write_full_report(weather_list, sys.stdout, stats)
+        sys.stdout.write("\n")
+    else:
+        print(generate_full_report(weather_list, cache, stats, name))
+    print(format_extremes(weather_list, stats))
+
+
+def cmd_all(cache: DiskCache | None = None) -> int:
+    from weather_report.weather_service import fetch_weather_batch
+
     print("Fetching weather data for all countries... This may take a few minutes.\n")
     countries = get_all_countries()
-    weather_list = fetch_weather_batch(countries, on_error="skip")
-    print(generate_full_report(weather_list))
-    print(format_extremes(weather_list))
+    weather_list = fetch_weather_batch(countries, on_error="skip", cache=cache)
+    _print_full_report(weather_list, cache, "all")
     return 0
 
 
-def cmd_country(name: str) -> int:
+def cmd_country(name: str, cache: DiskCache | None = None) -> int:
+    from weather_report.report import format_single_report
+    from weather_report.weather_service import WeatherServiceError, fetch_weather
+
     country = get_country_by_name(name)
     if not country:
         print(f"Error: Country '{name}' not found.", file=sys.stderr)
@@ -61,7 +88,7 @@ def cmd_country(name: str) -> int:
         return 1
 
     try:
-        weather = fetch_weather(country)
+        weather = fetch_weather(country, cache)
     except WeatherServiceError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -72,7 +99,9 @@ def cmd_country(name: str) -> int:
     return 0
 
 
-def cmd_continent(name: str) -> int:
+def cmd_continent(name: str, cache: DiskCache | None = None) -> int:
+    from weather_report.weather_service import fetch_weather_batch
+
     countries = get_countries_by_continent(name)
     if not countries:
         print(f"Error: Continent '{name}' not found.", file=sys.stderr)
@@ -80,9 +109,8 @@ def cmd_continent(name: str) -> int:
         return 1
 
     print(f"Fetching weather data for {name} ({len(countries)} countries)...\n")
-    weather_list = fetch_weather_batch(countries, on_error="skip")
-    print(generate_full_report(weather_list))
-    print(format_extremes(weather_list))
+    weather_list = fetch_weather_batch(countries, on_error="skip", cache=cache)
+    _print_full_report(weather_list, cache, "continent-" + name.lower().replace(" ", "-"))
     return 0
 
 
@@ -96,12 +124,11 @@ def cmd_list_countries() -> int:
 
 
 def cmd_list_continents() -> int:
-    continents = get_all_continents()
+    counts = Counter(c.continent for c in get_all_countries())
     print("\nAvailable Continents:")
     print("-" * 30)
-    for continent in continents:
-        countries = get_countries_by_continent(continent)
-        print(f"  {continent:<20} ({len(countries)} countries)")
+    for continent in get_all_continents():
+        print(f"  {continent:<20} ({counts[continent]} countries)")
     return 0
 
 
@@ -113,10 +140,11 @@ def main() -> int:
         parser.print_help()
         return 0
 
+    cache = None if args.no_cache else create_cache()
     commands = {
-        "all": lambda: cmd_all(),
-        "country": lambda: cmd_country(args.name),
-        "continent": lambda: cmd_continent(args.name),
+        "all": lambda: cmd_all(cache),
+        "country": lambda: cmd_country(args.name, cache),
+        "continent": lambda: cmd_continent(args.name, cache),
         "list-countries": lambda: cmd_list_countries(),
         "list-continents": lambda: cmd_list_continents(),
     }
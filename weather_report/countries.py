@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Country:
     name: str
     capital: str
@@ -213,20 +213,29 @@ COUNTRIES: list[Country] = [
 ]
 
 
+def _index_by_continent(countries: list[Country]) -> dict[str, list[Country]]:
+    index: dict[str, list[Country]] = {}
+    for country in countries:
+        index.setdefault(country.continent.lower(), []).append(country)
+    return index
+
+
+_COUNTRIES_BY_NAME = {c.name.lower(): c for c in COUNTRIES}
+_COUNTRIES_BY_CONTINENT = _index_by_continent(COUNTRIES)
+_CONTINENTS = sorted({c.continent for c in COUNTRIES})
+
+
 def get_all_countries() -> list[Country]:
     return list(COUNTRIES)
 
 
 def get_country_by_name(name: str) -> Country | None:
-    for country in COUNTRIES:
-        if country.name.lower() == name.lower():
-            return country
-    return None
+    return _COUNTRIES_BY_NAME.get(name.lower())
 
 
 def get_countries_by_continent(continent: str) -> list[Country]:
-    return [c for c in COUNTRIES if c.continent.lower() == continent.lower()]
+    return list(_COUNTRIES_BY_CONTINENT.get(continent.lower(), ()))
 
 
 def get_all_continents() -> list[str]:
-    return sorted(set(c.continent for c in COUNTRIES))
+    return list(_CONTINENTS)
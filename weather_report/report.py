@@ -1,8 +1,83 @@
 """Weather report generator and formatter module."""
 
+import hashlib
+import io
+import math
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import TextIO
 
-from weather_report.weather_service import WeatherData
+from weather_report.cache import DiskCache
+from weather_report.weather_service import WeatherCondition, WeatherData
+
+_CONDITION_LABELS = {c: c.value for c in WeatherCondition}
+_ROW_FORMAT = "{:<40} {:<25} {:<10.1f} {:<10.1f} {:<10} {:<12.1f} {:<15}".format
+_HEADER = "{:<40} {:<25} {:<10} {:<10} {:<10} {:<12} {:<15}".format(
+    "Country", "Capital", "Temp (C)", "Temp (F)", "Humidity", "Wind (km/h)", "Condition"
+)
+_CONTINENT_HEADER = "  {} ({} countries)".format
+_AVG_TEMP_FORMAT = "    Avg Temperature : {:.1f}°C".format
+_MIN_TEMP_FORMAT = "    Min Temperature : {:.1f}°C".format
+_MAX_TEMP_FORMAT = "    Max Temperature : {:.1f}°C".format
+_AVG_HUMIDITY_FORMAT = "    Avg Humidity    : {:.0f}%".format
+
+
+@dataclass(slots=True)
+class ContinentStats:
+    count: int = 0
+    temp_sum: float = 0.0
+    temp_min: float = math.inf
+    temp_max: float = -math.inf
+    humidity_sum: int = 0
+
+    @property
+    def temp_avg(self) -> float:
+        return self.temp_sum / self.count
+
+    @property
+    def humidity_avg(self) -> float:
+        return self.humidity_sum / self.count
+
+
+@dataclass(frozen=True, slots=True)
+class ReportStats:
+    continents: dict[str, ContinentStats]
+    extremes: dict[str, WeatherData | None]
+
+
+def compute_report_stats(weather_list: list[WeatherData]) -> ReportStats:
+    continent_stats: defaultdict[str, ContinentStats] = defaultdict(ContinentStats)
+    hottest = coldest = most_humid = windiest = weather_list[0] if weather_list else None
+    for w in weather_list:
+        temp = w.temperature_celsius
+        stats = continent_stats[w.continent]
+        stats.count += 1
+        stats.temp_sum += temp
+        if temp < stats.temp_min:
+            stats.temp_min = temp
+        if temp > stats.temp_max:
+            stats.temp_max = temp
+        stats.humidity_sum += w.humidity
+
+        if temp > hottest.temperature_celsius:
+            hottest = w
+        if temp < coldest.temperature_celsius:
+            coldest = w
+        if w.humidity > most_humid.humidity:
+            most_humid = w
+        if w.wind_speed_kmh > windiest.wind_speed_kmh:
+            windiest = w
+
+    return ReportStats(
+        continents=dict(continent_stats),
+        extremes={
+            "hottest": hottest,
+            "coldest": coldest,
+            "most_humid": most_humid,
+            "windiest": windiest,
+        },
+    )
 
 
 def format_single_report(weather: WeatherData) -> str:
@@ -13,96 +88,153 @@ def format_single_report(weather: WeatherData) -> str:
         f"  Temperature : {weather.temperature_display}",
         f"  Humidity    : {weather.humidity}%",
         f"  Wind Speed  : {weather.wind_speed_kmh:.1f} km/h",
-        f"  Condition   : {weather.condition.value}",
+        f"  Condition   : {_CONDITION_LABELS[weather.condition]}",
     ]
     return "\n".join(lines)
 
 
-def format_summary_table(weather_list: list[WeatherData]) -> str:
-    header = (
-        f"{'Country':<40} {'Capital':<25} {'Temp (C)':<10} {'Temp (F)':<10} "
-        f"{'Humidity':<10} {'Wind (km/h)':<12} {'Condition':<15}"
+def summary_table_lines(weather_list: list[WeatherData]) -> list[str]:
+    lines = [_HEADER, "-" * len(_HEADER)]
+    lines.extend(
+        _ROW_FORMAT(
+            w.country,
+            w.capital,
+            w.temperature_celsius,
+            w.temperature_fahrenheit,
+            w.humidity,
+            w.wind_speed_kmh,
+            _CONDITION_LABELS[w.condition],
+        )
+        for w in weather_list
     )
-    separator = "-" * len(header)
-    rows = []
+    return lines
+
+
+def format_summary_table(weather_list: list[WeatherData]) -> str:
+    return "\n".join(summary_table_lines(weather_list))
+
+
+def continent_summary_lines(
+    weather_list: list[WeatherData], stats: ReportStats | None = None
+) -> list[str]:
+    if stats is None:
+        stats = compute_report_stats(weather_list)
+    continent_stats = stats.continents
+
+    lines = []
+    for continent in sorted(continent_stats):
+        s = continent_stats[continent]
+        lines.extend(
+            (
+                "",
+                _CONTINENT_HEADER(continent, s.count),
+                _AVG_TEMP_FORMAT(s.temp_avg),
+                _MIN_TEMP_FORMAT(s.temp_min),
+                _MAX_TEMP_FORMAT(s.temp_max),
+                _AVG_HUMIDITY_FORMAT(s.humidity_avg),
+            )
+        )
+    return lines
+
+
+def format_continent_summary(
+    weather_list: list[WeatherData], stats: ReportStats | None = None
+) -> str:
+    return "\n".join(continent_summary_lines(weather_list, stats))
+
+
+def _report_digest(weather_list: list[WeatherData]) -> str:
+    digest = hashlib.sha1()
     for w in weather_list:
         row = (
-            f"{w.country:<40} {w.capital:<25} {w.temperature_celsius:<10.1f} "
-            f"{w.temperature_fahrenheit:<10.1f} {w.humidity:<10} "
-            f"{w.wind_speed_kmh:<12.1f} {w.condition.value:<15}"
+            w.country,
+            w.capital,
+            w.continent,
+            w.temperature_celsius,
+            w.humidity,
+            w.wind_speed_kmh,
+            w.weather_code,
         )
-        rows.append(row)
-    return "\n".join([header, separator] + rows)
+        digest.update(repr(row).encode())
+    return digest.hexdigest()
 
 
-def format_continent_summary(weather_list: list[WeatherData]) -> str:
-    continent_data: dict[str, list[WeatherData]] = {}
-    for w in weather_list:
-        continent_data.setdefault(w.continent, []).append(w)
+def generate_full_report(
+    weather_list: list[WeatherData],
+    cache: DiskCache | None = None,
+    stats: ReportStats | None = None,
+    name: str = "all",
+) -> str:
+    if cache is None:
+        return _build_full_report(weather_list, stats)
 
-    lines = []
-    for continent in sorted(continent_data.keys()):
-        data = continent_data[continent]
-        temps = [w.temperature_celsius for w in data]
-        avg_temp = sum(temps) / len(temps)
-        min_temp = min(temps)
-        max_temp = max(temps)
-        avg_humidity = sum(w.humidity for w in data) / len(data)
-        lines.append(f"\n  {continent} ({len(data)} countries)")
-        lines.append(f"    Avg Temperature : {avg_temp:.1f}°C")
-        lines.append(f"    Min Temperature : {min_temp:.1f}°C")
-        lines.append(f"    Max Temperature : {max_temp:.1f}°C")
-        lines.append(f"    Avg Humidity    : {avg_humidity:.0f}%")
+    # One entry per report name, overwritten on every rebuild; the digest
+    # ties it to the weather data it was generated from.
+    cache_key = f"report-{name}"
+    digest = _report_digest(weather_list)
+    entry = cache.get(cache_key)
+    if isinstance(entry, dict) and entry.get("digest") == digest:
+        return entry["report"]
+
+    report = _build_full_report(weather_list, stats)
+    cache.set(cache_key, {"digest": digest, "report": report})
+    return report
 
-    return "\n".join(lines)
 
+def _build_full_report(weather_list: list[WeatherData], stats: ReportStats | None) -> str:
+    buf = io.StringIO()
+    write_full_report(weather_list, buf, stats)
+    return buf.getvalue()
 
-def generate_full_report(weather_list: list[WeatherData]) -> str:
+
+def write_full_report(
+    weather_list: list[WeatherData], out: TextIO, stats: ReportStats | None = None
+) -> None:
     timestamp = datetime.now(tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-    sections = [
-        f"{'=' * 80}",
-        "  WORLD WEATHER REPORT",
-        f"  Generated: {timestamp}",
-        f"  Countries: {len(weather_list)}",
-        f"{'=' * 80}",
-        "",
-        "DETAILED TABLE",
-        "-" * 40,
-        format_summary_table(weather_list),
-        "",
-        "CONTINENT SUMMARY",
-        "-" * 40,
-        format_continent_summary(weather_list),
-        "",
-        f"{'=' * 80}",
-        f"  Report complete. {len(weather_list)} countries processed.",
-        f"{'=' * 80}",
-    ]
-    return "\n".join(sections)
-
-
-def find_extremes(weather_list: list[WeatherData]) -> dict[str, WeatherData | None]:
-    if not weather_list:
-        return {
-            "hottest": None,
-            "coldest": None,
-            "most_humid": None,
-            "windiest": None,
-        }
-    return {
-        "hottest": max(weather_list, key=lambda w: w.temperature_celsius),
-        "coldest": min(weather_list, key=lambda w: w.temperature_celsius),
-        "most_humid": max(weather_list, key=lambda w: w.humidity),
-        "windiest": max(weather_list, key=lambda w: w.wind_speed_kmh),
-    }
-
-
-def format_extremes(weather_list: list[WeatherData]) -> str:
-    extremes = find_extremes(weather_list)
+    sections = (
+        [
+            f"{'=' * 80}",
+            "  WORLD WEATHER REPORT",
+            f"  Generated: {timestamp}",
+            f"  Countries: {len(weather_list)}",
+            f"{'=' * 80}",
+            "",
+            "DETAILED TABLE",
+            "-" * 40,
+        ],
+        summary_table_lines(weather_list),
+        ["", "CONTINENT SUMMARY", "-" * 40],
+        # An empty summary still leaves its own blank line in the report.
+        continent_summary_lines(weather_list, stats) or [""],
+        [
+            "",
+            f"{'=' * 80}",
+            f"  Report complete. {len(weather_list)} countries processed.",
+            f"{'=' * 80}",
+        ],
+    )
+    for i, section in enumerate(sections):
+        if i:
+            out.write("\n")
+        out.write("\n".join(section))
+
+
+def find_extremes(
+    weather_list: list[WeatherData], stats: ReportStats | None = None
+) -> dict[str, WeatherData | None]:
+    if stats is None:
+        stats = compute_report_stats(weather_list)
+    return dict(stats.extremes)
+
+
+def extremes_lines(
+    weather_list: list[WeatherData], stats: ReportStats | None = None
+) -> list[str]:
+    extremes = find_extremes(weather_list, stats)
     if not any(extremes.values()):
-        return "No data available for extremes."
+        return ["No data available for extremes."]
 
-    lines = ["\n  WEATHER EXTREMES", "  " + "-" * 40]
+    lines = ["", "  WEATHER EXTREMES", "  " + "-" * 40]
 
     hottest = extremes["hottest"]
     if hottest:
@@ -132,4 +264,8 @@ def format_extremes(weather_list: list[WeatherData]) -> str:
             f"- {windiest.wind_speed_kmh:.1f} km/h"
         )
 
-    return "\n".join(lines)
+    return lines
+
+
+def format_extremes(weather_list: list[WeatherData], stats: ReportStats | None = None) -> str:
+    return "\n".join(extremes_lines(weather_list, stats))
@@ -1,14 +1,48 @@
 """Weather service module for fetching weather data via Open-Meteo API."""
 
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from weather_report.cache import DiskCache
 from weather_report.countries import Country
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 OPEN_METEO_BASE_URL = "https://api.open-meteo.com/v1/forecast"
 REQUEST_TIMEOUT = 10
+MAX_WORKERS = 32
+BULK_CHUNK_SIZE = 100
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+CURRENT_FIELDS = "temperature_2m,relative_humidity_2m,weather_code,wind_speed_10m"
+WEATHER_CACHE_TTL = 300.0
+WEATHER_CACHE_MAX_ENTRIES = 512
+
+_BASE_PARAMS = {"current": CURRENT_FIELDS}
+
+
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=RETRY_STATUS_CODES)
+    adapter = HTTPAdapter(
+        pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, max_retries=retries
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _create_session()
 
 
 class WeatherCondition(Enum):
@@ -54,19 +88,24 @@ WMO_CODE_MAP: dict[int, WeatherCondition] = {
     99: WeatherCondition.THUNDERSTORM,
 }
 
+_WMO_TABLE = tuple(WMO_CODE_MAP.get(code, WeatherCondition.UNKNOWN) for code in range(100))
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WeatherData:
     country: str
     capital: str
     continent: str
     temperature_celsius: float
-    temperature_fahrenheit: float
     humidity: int
     wind_speed_kmh: float
     condition: WeatherCondition
     weather_code: int
 
+    @property
+    def temperature_fahrenheit(self) -> float:
+        return celsius_to_fahrenheit(self.temperature_celsius)
+
     @property
     def temperature_display(self) -> str:
         return f"{self.temperature_celsius:.1f}°C / {self.temperature_fahrenheit:.1f}°F"
@@ -76,37 +115,72 @@ class WeatherServiceError(Exception):
     pass
 
 
+_weather_cache: OrderedDict[Country, tuple[float, WeatherData]] = OrderedDict()
+_weather_cache_lock = threading.Lock()
+
+
 def celsius_to_fahrenheit(celsius: float) -> float:
     return (celsius * 9 / 5) + 32
 
 
 def interpret_weather_code(code: int) -> WeatherCondition:
-    return WMO_CODE_MAP.get(code, WeatherCondition.UNKNOWN)
+    return _WMO_TABLE[code] if 0 <= code < 100 else WeatherCondition.UNKNOWN
 
 
-def fetch_weather(country: Country) -> WeatherData:
-    params = {
-        "latitude": country.latitude,
-        "longitude": country.longitude,
-        "current": "temperature_2m,relative_humidity_2m,weather_code,wind_speed_10m",
-    }
+def _decode_json(response: requests.Response) -> Any:
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _conditional_headers(validators: dict[str, str]) -> dict[str, str]:
+    headers = {}
+    if "etag" in validators:
+        headers["If-None-Match"] = validators["etag"]
+    if "last_modified" in validators:
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def _response_validators(response: requests.Response) -> dict[str, str]:
+    validators = {}
+    if etag := response.headers.get("ETag"):
+        validators["etag"] = etag
+    if last_modified := response.headers.get("Last-Modified"):
+        validators["last_modified"] = last_modified
+    return validators
+
+
+def _request_current(
+    country: Country, validators: dict[str, str] | None = None
+) -> tuple[dict | None, dict[str, str]]:
+    params = {**_BASE_PARAMS, "latitude": country.latitude, "longitude": country.longitude}
+    headers = _conditional_headers(validators or {})
 
     try:
-        response = requests.get(OPEN_METEO_BASE_URL, params=params, timeout=REQUEST_TIMEOUT)
+        response = _SESSION.get(
+            OPEN_METEO_BASE_URL, params=params, headers=headers, timeout=REQUEST_TIMEOUT
+        )
         response.raise_for_status()
     except requests.RequestException as e:
         raise WeatherServiceError(
             f"Failed to fetch weather for {country.name} ({country.capital}): {e}"
         ) from e
 
+    # 304 Not Modified: the caller's stale copy is still current.
+    if headers and response.status_code == 304:
+        return None, validators or {}
+
     try:
-        data = response.json()
-        current = data["current"]
+        data = _decode_json(response)
+        return data["current"], _response_validators(response)
     except (ValueError, KeyError) as e:
         raise WeatherServiceError(
             f"Invalid response for {country.name} ({country.capital}): {e}"
         ) from e
 
+
+def _build_weather_data(country: Country, current: dict) -> WeatherData:
     temp_c = float(current["temperature_2m"])
     weather_code = int(current["weather_code"])
 
@@ -115,7 +189,6 @@ def fetch_weather(country: Country) -> WeatherData:
         capital=country.capital,
         continent=country.continent,
         temperature_celsius=temp_c,
-        temperature_fahrenheit=celsius_to_fahrenheit(temp_c),
         humidity=int(current["relative_humidity_2m"]),
         wind_speed_kmh=float(current["wind_speed_10m"]),
         condition=interpret_weather_code(weather_code),
@@ -123,16 +196,191 @@ def fetch_weather(country: Country) -> WeatherData:
     )
 
 
+def _get_cached_weather(country: Country) -> WeatherData | None:
+    with _weather_cache_lock:
+        entry = _weather_cache.get(country)
+        if entry is None:
+            return None
+        fetched_at, weather = entry
+        if time.monotonic() - fetched_at >= WEATHER_CACHE_TTL:
+            del _weather_cache[country]
+            return None
+        _weather_cache.move_to_end(country)
+        return weather
+
+
+def _cache_weather(country: Country, weather: WeatherData, age: float = 0.0) -> None:
+    with _weather_cache_lock:
+        _weather_cache[country] = (time.monotonic() - age, weather)
+        _weather_cache.move_to_end(country)
+        while len(_weather_cache) > WEATHER_CACHE_MAX_ENTRIES:
+            _weather_cache.popitem(last=False)
+
+
+def close_session() -> None:
+    _SESSION.close()
+
+
+def invalidate_weather_cache() -> None:
+    with _weather_cache_lock:
+        _weather_cache.clear()
+
+
+def _cache_key(country: Country) -> str:
+    return f"weather-{country.latitude}_{country.longitude}"
+
+
+def _build_cached_weather(country: Country, current: Any) -> WeatherData | None:
+    # A malformed disk entry is treated as a miss so it gets refetched and overwritten.
+    try:
+        return _build_weather_data(country, current)
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def _lookup_cached_weather(country: Country, cache: DiskCache | None) -> WeatherData | None:
+    weather = _get_cached_weather(country)
+    if weather is None and cache:
+        hit = cache.get_with_age(_cache_key(country))
+        if hit is not None:
+            current, age = hit
+            weather = _build_cached_weather(country, current)
+            if weather is not None:
+                # Keep the disk entry's age so memory never extends its lifetime.
+                _cache_weather(country, weather, age)
+    return weather
+
+
+def _store_weather(
+    country: Country,
+    current: dict,
+    cache: DiskCache | None,
+    validators: dict[str, str] | None = None,
+) -> WeatherData:
+    weather = _build_weather_data(country, current)
+    if cache:
+        key = _cache_key(country)
+        if validators is None:
+            # Bulk responses carry no per-location validators; keep any that an
+            # earlier single fetch stored so the entry can still be revalidated.
+            stale = cache.get_stale(key)
+            validators = stale[1] if stale else None
+        cache.set(key, current, validators)
+    _cache_weather(country, weather)
+    return weather
+
+
+def fetch_weather(country: Country, cache: DiskCache | None = None) -> WeatherData:
+    weather = _lookup_cached_weather(country, cache)
+    if weather is not None:
+        return weather
+
+    stale = cache.get_stale(_cache_key(country)) if cache else None
+    if stale is not None and _build_cached_weather(country, stale[0]) is None:
+        # Never revalidate an unusable entry: a 304 would hand it back again.
+        stale = None
+    if stale is None:
+        current, validators = _request_current(country)
+    else:
+        current, validators = _request_current(country, stale[1])
+        if current is None:
+            current = stale[0]
+
+    try:
+        return _store_weather(country, current, cache, validators)
+    except (ValueError, KeyError, TypeError) as e:
+        raise WeatherServiceError(
+            f"Invalid response for {country.name} ({country.capital}): {e}"
+        ) from e
+
+
+def _request_current_bulk(countries: list[Country]) -> list[dict | None]:
+    params = {
+        **_BASE_PARAMS,
+        "latitude": ",".join(str(c.latitude) for c in countries),
+        "longitude": ",".join(str(c.longitude) for c in countries),
+    }
+
+    try:
+        response = _SESSION.get(OPEN_METEO_BASE_URL, params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        raise WeatherServiceError(
+            f"Failed to fetch weather for {len(countries)} locations: {e}"
+        ) from e
+
+    try:
+        data = _decode_json(response)
+        # A single location comes back as an object rather than a one-element list.
+        if isinstance(data, dict):
+            data = [data]
+        if len(data) != len(countries):
+            raise ValueError(f"expected {len(countries)} locations, got {len(data)}")
+        # Malformed locations are passed through as None and rejected one by one.
+        return [entry.get("current") if isinstance(entry, dict) else None for entry in data]
+    except (ValueError, TypeError) as e:
+        raise WeatherServiceError(
+            f"Invalid response for {len(countries)} locations: {e}"
+        ) from e
+
+
+def _fetch_weather_chunk(
+    countries: list[Country], cache: DiskCache | None, on_error: str
+) -> list[WeatherData | None]:
+    results: list[WeatherData | None] = []
+    for country, current in zip(countries, _request_current_bulk(countries)):
+        try:
+            results.append(_store_weather(country, current, cache))
+        except (ValueError, KeyError, TypeError) as e:
+            if on_error == "raise":
+                raise WeatherServiceError(
+                    f"Invalid response for {country.name} ({country.capital}): {e}"
+                ) from e
+            results.append(None)
+    return results
+
+
+def fetch_weather_bulk(
+    countries: list[Country],
+    on_error: str = "skip",
+    cache: DiskCache | None = None,
+) -> list[WeatherData]:
+    results: list[WeatherData | None] = [None] * len(countries)
+    pending: list[int] = []
+    for i, country in enumerate(countries):
+        results[i] = _lookup_cached_weather(country, cache)
+        if results[i] is None:
+            pending.append(i)
+
+    chunks = [
+        pending[start : start + BULK_CHUNK_SIZE]
+        for start in range(0, len(pending), BULK_CHUNK_SIZE)
+    ]
+    if chunks:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(chunks))) as executor:
+            futures = [
+                executor.submit(
+                    _fetch_weather_chunk, [countries[i] for i in chunk], cache, on_error
+                )
+                for chunk in chunks
+            ]
+            for chunk, future in zip(chunks, futures):
+                try:
+                    weather_list = future.result()
+                except WeatherServiceError:
+                    if on_error == "raise":
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        raise
+                    continue
+                for i, weather in zip(chunk, weather_list):
+                    results[i] = weather
+
+    return [w for w in results if w is not None]
+
+
 def fetch_weather_batch(
     countries: list[Country],
     on_error: str = "skip",
+    cache: DiskCache | None = None,
 ) -> list[WeatherData]:
-    results: list[WeatherData] = []
-    for country in countries:
-        try:
-            weather = fetch_weather(country)
-            results.append(weather)
-        except WeatherServiceError:
-            if on_error == "raise":
-                raise
-    return results
+    return fetch_weather_bulk(countries, on_error=on_error, cache=cache)